@@ -16,8 +16,6 @@
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
 import json  # type: ignore
-import grpc  # type: ignore
-from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
@@ -32,11 +30,28 @@ from google.iam.v1 import iam_policy_pb2  # type: ignore
 from google.iam.v1 import policy_pb2  # type: ignore
 from google.cloud.location import locations_pb2  # type: ignore
 from requests import __version__ as requests_version
+from requests.adapters import HTTPAdapter
 import dataclasses
-import re
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 import warnings
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: NO COVER
+    orjson = None
+
 try:
     OptionalRetry = Union[retries.Retry, gapic_v1.method._MethodDefault, None]
 except AttributeError:  # pragma: NO COVER
@@ -63,6 +78,90 @@ DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
     rest_version=requests_version,
 )
 
+# Connections kept open per host by the transport's session. The requests
+# default of 10 makes concurrent callers sharing one transport discard and
+# re-open connections.
+_SESSION_POOL_MAXSIZE = 32
+
+
+def _parse_json(
+    content: Union[bytes, str], message: Any, ignore_unknown_fields: bool = False
+) -> Any:
+    """Merge the JSON body of an HTTP response into ``message``.
+
+    The body is decoded with orjson when it is installed, which is notably
+    faster than the standard library on large list responses, and the result
+    is handed to ``json_format.ParseDict``. Without orjson this is
+    ``json_format.Parse``.
+
+    Malformed JSON raises ``json_format.ParseError`` on both paths. Unlike
+    ``json_format.Parse``, orjson does not reject objects with duplicate keys;
+    the last value wins.
+    """
+    if orjson is None:
+        return json_format.Parse(
+            content, message, ignore_unknown_fields=ignore_unknown_fields
+        )
+    try:
+        js = orjson.loads(content)
+    except orjson.JSONDecodeError as e:
+        raise json_format.ParseError(f"Failed to load JSON: {e}.") from e
+    return json_format.ParseDict(
+        js, message, ignore_unknown_fields=ignore_unknown_fields
+    )
+
+
+def _message_to_json(message: Any) -> bytes:
+    """Serialize ``message`` as the UTF-8 encoded JSON body of an HTTP request.
+
+    Enums are written as integers. With orjson installed the message is
+    converted by ``json_format.MessageToDict`` and encoded to compact bytes;
+    otherwise this is ``json_format.MessageToJson``.
+    """
+    if orjson is None:
+        return json_format.MessageToJson(message, use_integers_for_enums=True).encode(
+            "utf-8"
+        )
+    return orjson.dumps(json_format.MessageToDict(message, use_integers_for_enums=True))
+
+
+def _index_http_options(
+    http_options: Sequence[Mapping[str, str]]
+) -> Dict[Tuple[str, ...], List[Mapping[str, str]]]:
+    """Group ``http_options`` by the literal segments of their ``name`` binding.
+
+    The operations templates bind ``name`` to patterns that alternate literal
+    collection ids with ``*`` (``projects/*/locations/*/operations/*``), so a
+    resource name can only match the templates whose literals equal its
+    even-numbered segments. Looking a name up in the index narrows the
+    candidates handed to ``path_template.transcode`` to those templates, in
+    their original order.
+
+    Returns an empty index, so that callers use the full list, if any
+    template is not of that shape.
+    """
+    index: Dict[Tuple[str, ...], List[Mapping[str, str]]] = {}
+    for http_option in http_options:
+        _, sep, binding = http_option["uri"].partition("{name=")
+        segments = binding.partition("}")[0].split("/")
+        if not sep or len(segments) % 2 or any(s != "*" for s in segments[1::2]):
+            return {}
+        index.setdefault(tuple(segments[::2]), []).append(http_option)
+    return index
+
+
+def _select_http_options(stub: type, name: str) -> Sequence[Mapping[str, str]]:
+    """Return the ``_HTTP_OPTIONS`` of ``stub`` that can match resource ``name``.
+
+    The index from ``_index_http_options`` is built on the first call for each
+    stub class and cached on it, so importing the transport does not pay for
+    operations that are never called.
+    """
+    index = stub.__dict__.get("_HTTP_OPTIONS_BY_NAME")
+    if index is None:
+        index = stub._HTTP_OPTIONS_BY_NAME = _index_http_options(stub._HTTP_OPTIONS)
+    return index.get(tuple(name.split("/")[::2]), stub._HTTP_OPTIONS)
+
 
 class FeaturestoreServiceRestInterceptor:
     """Interceptor for FeaturestoreService.
@@ -979,6 +1078,333 @@ class FeaturestoreServiceRestStub:
     _host: str
     _interceptor: FeaturestoreServiceRestInterceptor
 
+    # Query params that must be sent even when unset, with their default
+    # values. Stubs for methods that have none leave this empty.
+    _REQUIRED_FIELDS_DEFAULT_VALUES: ClassVar[Dict[str, Any]] = {}
+
+    # Hash of the RPC name, computed once per stub class. Clients hash the
+    # stub on every call to look up its wrapped method.
+    _HASH: ClassVar[int] = hash("FeaturestoreServiceRestStub")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._HASH = hash(cls.__name__.lstrip("_"))
+
+    def __hash__(self):
+        return self._HASH
+
+    @classmethod
+    def _get_unset_required_fields(cls, message_dict):
+        if not cls._REQUIRED_FIELDS_DEFAULT_VALUES:
+            return {}
+        return {
+            k: v
+            for k, v in cls._REQUIRED_FIELDS_DEFAULT_VALUES.items()
+            if k not in message_dict
+        }
+
+
+def _versioned_http_options(
+    method: str, v1_uris: List[str], ui_only_uris: List[str]
+) -> Tuple[Mapping[str, str], ...]:
+    """Expand version-less URI templates into ``/ui`` and ``/v1`` bindings.
+
+    Every ``/v1`` template is also served under ``/ui``, which additionally
+    exposes ``ui_only_uris``. The ``/ui`` bindings come first so that they keep
+    their precedence in ``path_template.transcode``.
+    """
+    return tuple(
+        MappingProxyType({"method": method, "uri": f"{version}{uri}"})
+        for version, uris in (("/ui", v1_uris + ui_only_uris), ("/v1", v1_uris))
+        for uri in uris
+    )
+
+
+# HTTP bindings for the long-running operations client. Built once at import
+# and shared, read-only, by every transport instance.
+_OPERATIONS_HTTP_OPTIONS: Mapping[
+    str, Tuple[Mapping[str, str], ...]
+] = MappingProxyType(
+    {
+        "google.longrunning.Operations.CancelOperation": _versioned_http_options(
+            "post",
+            [
+                "/{name=projects/*/locations/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/datasets/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/endpoints/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/featurestores/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/customJobs/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/tuningJobs/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/indexes/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/indexEndpoints/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/metadataStores/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/migratableResources/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/models/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/persistentResources/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/studies/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/studies/*/trials/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/trainingPipelines/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/pipelineJobs/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/schedules/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/specialistPools/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/tensorboards/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}:cancel",
+            ],
+            ui_only_uris=[
+                "/{name=projects/*/locations/*/agents/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/apps/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/edgeDevices/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/extensionControllers/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/extensions/*/operations/*}:cancel",
+                "/{name=projects/*/locations/*/modelMonitors/*/operations/*}:cancel",
+            ],
+        ),
+        "google.longrunning.Operations.DeleteOperation": _versioned_http_options(
+            "delete",
+            [
+                "/{name=projects/*/locations/*/operations/*}",
+                "/{name=projects/*/locations/*/datasets/*/operations/*}",
+                "/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}",
+                "/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}",
+                "/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}",
+                "/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}",
+                "/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}",
+                "/{name=projects/*/locations/*/endpoints/*/operations/*}",
+                "/{name=projects/*/locations/*/featurestores/*/operations/*}",
+                "/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}",
+                "/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}",
+                "/{name=projects/*/locations/*/customJobs/*/operations/*}",
+                "/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}",
+                "/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}",
+                "/{name=projects/*/locations/*/indexes/*/operations/*}",
+                "/{name=projects/*/locations/*/indexEndpoints/*/operations/*}",
+                "/{name=projects/*/locations/*/metadataStores/*/operations/*}",
+                "/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}",
+                "/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}",
+                "/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}",
+                "/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}",
+                "/{name=projects/*/locations/*/migratableResources/*/operations/*}",
+                "/{name=projects/*/locations/*/models/*/operations/*}",
+                "/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}",
+                "/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}",
+                "/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}",
+                "/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}",
+                "/{name=projects/*/locations/*/studies/*/operations/*}",
+                "/{name=projects/*/locations/*/studies/*/trials/*/operations/*}",
+                "/{name=projects/*/locations/*/trainingPipelines/*/operations/*}",
+                "/{name=projects/*/locations/*/persistentResources/*/operations/*}",
+                "/{name=projects/*/locations/*/pipelineJobs/*/operations/*}",
+                "/{name=projects/*/locations/*/schedules/*/operations/*}",
+                "/{name=projects/*/locations/*/specialistPools/*/operations/*}",
+                "/{name=projects/*/locations/*/tensorboards/*/operations/*}",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}",
+                "/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}",
+                "/{name=projects/*/locations/*/featureGroups/*/operations/*}",
+                "/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}",
+                "/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}",
+            ],
+            ui_only_uris=[
+                "/{name=projects/*/locations/*/agents/*/operations/*}",
+                "/{name=projects/*/locations/*/apps/*/operations/*}",
+                "/{name=projects/*/locations/*/edgeDevices/*/operations/*}",
+                "/{name=projects/*/locations/*/extensionControllers/*}/operations",
+                "/{name=projects/*/locations/*/extensions/*}/operations",
+                "/{name=projects/*/locations/*/modelMonitors/*/operations/*}",
+            ],
+        ),
+        "google.longrunning.Operations.GetOperation": _versioned_http_options(
+            "get",
+            [
+                "/{name=projects/*/locations/*/operations/*}",
+                "/{name=projects/*/locations/*/datasets/*/operations/*}",
+                "/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}",
+                "/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}",
+                "/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}",
+                "/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}",
+                "/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}",
+                "/{name=projects/*/locations/*/endpoints/*/operations/*}",
+                "/{name=projects/*/locations/*/featurestores/*/operations/*}",
+                "/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}",
+                "/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}",
+                "/{name=projects/*/locations/*/customJobs/*/operations/*}",
+                "/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}",
+                "/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}",
+                "/{name=projects/*/locations/*/tuningJobs/*/operations/*}",
+                "/{name=projects/*/locations/*/indexes/*/operations/*}",
+                "/{name=projects/*/locations/*/indexEndpoints/*/operations/*}",
+                "/{name=projects/*/locations/*/metadataStores/*/operations/*}",
+                "/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}",
+                "/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}",
+                "/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}",
+                "/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}",
+                "/{name=projects/*/locations/*/migratableResources/*/operations/*}",
+                "/{name=projects/*/locations/*/models/*/operations/*}",
+                "/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}",
+                "/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}",
+                "/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}",
+                "/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}",
+                "/{name=projects/*/locations/*/studies/*/operations/*}",
+                "/{name=projects/*/locations/*/studies/*/trials/*/operations/*}",
+                "/{name=projects/*/locations/*/trainingPipelines/*/operations/*}",
+                "/{name=projects/*/locations/*/persistentResources/*/operations/*}",
+                "/{name=projects/*/locations/*/pipelineJobs/*/operations/*}",
+                "/{name=projects/*/locations/*/schedules/*/operations/*}",
+                "/{name=projects/*/locations/*/specialistPools/*/operations/*}",
+                "/{name=projects/*/locations/*/tensorboards/*/operations/*}",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}",
+                "/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}",
+                "/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}",
+                "/{name=projects/*/locations/*/featureGroups/*/operations/*}",
+                "/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}",
+            ],
+            ui_only_uris=[
+                "/{name=projects/*/locations/*/agents/*/operations/*}",
+                "/{name=projects/*/locations/*/apps/*/operations/*}",
+                "/{name=projects/*/locations/*/edgeDeploymentJobs/*/operations/*}",
+                "/{name=projects/*/locations/*/edgeDevices/*/operations/*}",
+                "/{name=projects/*/locations/*/extensionControllers/*/operations/*}",
+                "/{name=projects/*/locations/*/extensions/*/operations/*}",
+                "/{name=projects/*/locations/*/modelMonitors/*/operations/*}",
+            ],
+        ),
+        "google.longrunning.Operations.ListOperations": _versioned_http_options(
+            "get",
+            [
+                "/{name=projects/*/locations/*}/operations",
+                "/{name=projects/*/locations/*/datasets/*}/operations",
+                "/{name=projects/*/locations/*/datasets/*/dataItems/*}/operations",
+                "/{name=projects/*/locations/*/datasets/*/savedQueries/*}/operations",
+                "/{name=projects/*/locations/*/datasets/*/annotationSpecs/*}/operations",
+                "/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*}/operations",
+                "/{name=projects/*/locations/*/deploymentResourcePools/*}/operations",
+                "/{name=projects/*/locations/*/endpoints/*}/operations",
+                "/{name=projects/*/locations/*/featurestores/*}/operations",
+                "/{name=projects/*/locations/*/featurestores/*/entityTypes/*}/operations",
+                "/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*}/operations",
+                "/{name=projects/*/locations/*/customJobs/*}/operations",
+                "/{name=projects/*/locations/*/dataLabelingJobs/*}/operations",
+                "/{name=projects/*/locations/*/hyperparameterTuningJobs/*}/operations",
+                "/{name=projects/*/locations/*/tuningJobs/*}/operations",
+                "/{name=projects/*/locations/*/indexes/*}/operations",
+                "/{name=projects/*/locations/*/indexEndpoints/*}/operations",
+                "/{name=projects/*/locations/*/metadataStores/*}/operations",
+                "/{name=projects/*/locations/*/metadataStores/*/artifacts/*}/operations",
+                "/{name=projects/*/locations/*/metadataStores/*/contexts/*}/operations",
+                "/{name=projects/*/locations/*/metadataStores/*/executions/*}/operations",
+                "/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*}/operations",
+                "/{name=projects/*/locations/*/migratableResources/*}/operations",
+                "/{name=projects/*/locations/*/models/*}/operations",
+                "/{name=projects/*/locations/*/models/*/evaluations/*}/operations",
+                "/{name=projects/*/locations/*/notebookExecutionJobs/*}/operations",
+                "/{name=projects/*/locations/*/notebookRuntimes/*}/operations",
+                "/{name=projects/*/locations/*/notebookRuntimeTemplates/*}/operations",
+                "/{name=projects/*/locations/*/studies/*}/operations",
+                "/{name=projects/*/locations/*/studies/*/trials/*}/operations",
+                "/{name=projects/*/locations/*/trainingPipelines/*}/operations",
+                "/{name=projects/*/locations/*/persistentResources/*}/operations",
+                "/{name=projects/*/locations/*/pipelineJobs/*}/operations",
+                "/{name=projects/*/locations/*/schedules/*}/operations",
+                "/{name=projects/*/locations/*/specialistPools/*}/operations",
+                "/{name=projects/*/locations/*/tensorboards/*}/operations",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*}/operations",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*}/operations",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*}/operations",
+                "/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/featureGroups/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}:wait",
+            ],
+            ui_only_uris=[
+                "/{name=projects/*/locations/*/agents/*}/operations",
+                "/{name=projects/*/locations/*/apps/*}/operations",
+                "/{name=projects/*/locations/*/edgeDevices/*}/operations",
+                "/{name=projects/*/locations/*/extensionControllers/*}/operations",
+                "/{name=projects/*/locations/*/extensions/*}/operations",
+                "/{name=projects/*/locations/*/modelMonitors/*}/operations",
+            ],
+        ),
+        "google.longrunning.Operations.WaitOperation": _versioned_http_options(
+            "post",
+            [
+                "/{name=projects/*/locations/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/datasets/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/endpoints/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/featurestores/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/customJobs/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/indexes/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/indexEndpoints/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/metadataStores/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/migratableResources/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/models/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/studies/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/studies/*/trials/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/trainingPipelines/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/persistentResources/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/pipelineJobs/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/schedules/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/specialistPools/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/tensorboards/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/featureGroups/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}:wait",
+            ],
+            ui_only_uris=[
+                "/{name=projects/*/locations/*/agents/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/apps/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/edgeDevices/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/extensionControllers/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/extensions/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/tuningJobs/*/operations/*}:wait",
+                "/{name=projects/*/locations/*/modelMonitors/*/operations/*}:wait",
+            ],
+        ),
+    }
+)
+
 
 class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
     """REST backend transport for FeaturestoreService.
@@ -1045,15 +1471,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
-        maybe_url_match = re.match("^(?P<scheme>http(?:s)?://)?(?P<host>.*)$", host)
-        if maybe_url_match is None:
-            raise ValueError(
-                f"Unexpected hostname structure: {host}"
-            )  # pragma: NO COVER
-
-        url_match_items = maybe_url_match.groupdict()
-
-        host = f"{url_scheme}://{host}" if not url_match_items["scheme"] else host
+        if not host.startswith(("http://", "https://")):
+            host = f"{url_scheme}://{host}"
 
         super().__init__(
             host=host,
@@ -1065,6 +1484,9 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
         self._session = AuthorizedSession(
             self._credentials, default_host=self.DEFAULT_HOST
         )
+        adapter = HTTPAdapter(pool_maxsize=_SESSION_POOL_MAXSIZE)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._operations_client: Optional[operations_v1.AbstractOperationsClient] = None
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
@@ -1080,1825 +1502,12 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
         """
         # Only create a new client if we do not already have one.
         if self._operations_client is None:
-            http_options: Dict[str, List[Dict[str, str]]] = {
-                "google.longrunning.Operations.CancelOperation": [
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/agents/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/apps/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/edgeDevices/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/endpoints/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/extensionControllers/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/extensions/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/customJobs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/tuningJobs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/indexes/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/indexEndpoints/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/modelMonitors/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/migratableResources/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/models/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/persistentResources/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/studies/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/studies/*/trials/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/trainingPipelines/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/pipelineJobs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/schedules/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/specialistPools/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/endpoints/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/customJobs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/tuningJobs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/indexes/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/indexEndpoints/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/migratableResources/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/models/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/persistentResources/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/studies/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/studies/*/trials/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/trainingPipelines/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/pipelineJobs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/schedules/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/specialistPools/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}:cancel",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}:cancel",
-                    },
-                ],
-                "google.longrunning.Operations.DeleteOperation": [
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/agents/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/apps/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/edgeDevices/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/endpoints/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/extensionControllers/*}/operations",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/extensions/*}/operations",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/customJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/indexes/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/indexEndpoints/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/modelMonitors/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/migratableResources/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/models/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/persistentResources/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/studies/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/studies/*/trials/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/trainingPipelines/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/pipelineJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/schedules/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/specialistPools/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/endpoints/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/customJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/indexes/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/indexEndpoints/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/migratableResources/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/models/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/studies/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/studies/*/trials/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/trainingPipelines/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/persistentResources/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/pipelineJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/schedules/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/specialistPools/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}",
-                    },
-                    {
-                        "method": "delete",
-                        "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}",
-                    },
-                ],
-                "google.longrunning.Operations.GetOperation": [
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/agents/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/apps/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/edgeDeploymentJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/edgeDevices/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/endpoints/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/extensionControllers/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/extensions/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/customJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/tuningJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/indexes/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/indexEndpoints/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/modelMonitors/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/migratableResources/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/models/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/persistentResources/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/studies/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/studies/*/trials/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/trainingPipelines/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/pipelineJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/schedules/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/specialistPools/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/endpoints/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/customJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/tuningJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/indexes/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/indexEndpoints/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/migratableResources/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/models/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/studies/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/studies/*/trials/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/trainingPipelines/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/persistentResources/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/pipelineJobs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/schedules/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/specialistPools/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/operations/*}",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}",
-                    },
-                ],
-                "google.longrunning.Operations.ListOperations": [
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/agents/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/apps/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/savedQueries/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/annotationSpecs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/deploymentResourcePools/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/edgeDevices/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/endpoints/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/extensionControllers/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/extensions/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/customJobs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/dataLabelingJobs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/hyperparameterTuningJobs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/tuningJobs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/indexes/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/indexEndpoints/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/artifacts/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/contexts/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/executions/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/modelMonitors/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/migratableResources/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/models/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/models/*/evaluations/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookExecutionJobs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookRuntimes/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookRuntimeTemplates/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/studies/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/studies/*/trials/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/trainingPipelines/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/persistentResources/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/pipelineJobs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/schedules/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/specialistPools/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/savedQueries/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/annotationSpecs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/deploymentResourcePools/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/endpoints/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/customJobs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/dataLabelingJobs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/hyperparameterTuningJobs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/tuningJobs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/indexes/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/indexEndpoints/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/artifacts/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/contexts/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/executions/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/migratableResources/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/models/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/models/*/evaluations/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookExecutionJobs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookRuntimes/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookRuntimeTemplates/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/studies/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/studies/*/trials/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/trainingPipelines/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/persistentResources/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/pipelineJobs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/schedules/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/specialistPools/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*}/operations",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "get",
-                        "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}:wait",
-                    },
-                ],
-                "google.longrunning.Operations.WaitOperation": [
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/agents/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/apps/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/edgeDevices/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/endpoints/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/extensionControllers/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/extensions/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/customJobs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/tuningJobs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/indexes/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/indexEndpoints/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/modelMonitors/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/migratableResources/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/models/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/studies/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/studies/*/trials/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/trainingPipelines/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/persistentResources/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/pipelineJobs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/schedules/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/specialistPools/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/endpoints/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/customJobs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/indexes/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/indexEndpoints/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/migratableResources/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/models/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/studies/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/studies/*/trials/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/trainingPipelines/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/persistentResources/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/pipelineJobs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/schedules/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/specialistPools/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/operations/*}:wait",
-                    },
-                    {
-                        "method": "post",
-                        "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}:wait",
-                    },
-                ],
-            }
-
             rest_transport = operations_v1.OperationsRestTransport(
                 host=self._host,
                 # use the credentials which are saved
                 credentials=self._credentials,
                 scopes=self._scopes,
-                http_options=http_options,
+                http_options=_OPERATIONS_HTTP_OPTIONS,
                 path_prefix="v1",
             )
 
@@ -2910,18 +1519,15 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
         return self._operations_client
 
     class _BatchCreateFeatures(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("BatchCreateFeatures")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "post",
+                    "uri": "/v1/{parent=projects/*/locations/*/featurestores/*/entityTypes/*}/features:batchCreate",
+                    "body": "*",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -2951,33 +1557,21 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1/{parent=projects/*/locations/*/featurestores/*/entityTypes/*}/features:batchCreate",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_batch_create_features(
                 request, metadata
             )
             pb_request = featurestore_service.BatchCreateFeaturesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"], use_integers_for_enums=True
-            )
+            body = _message_to_json(transcoded_request["body"])
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -2986,8 +1580,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.post(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -3001,23 +1595,20 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            _parse_json(response.content, resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_batch_create_features(resp)
             return resp
 
     class _BatchReadFeatureValues(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("BatchReadFeatureValues")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "post",
+                    "uri": "/v1/{featurestore=projects/*/locations/*/featurestores/*}:batchReadFeatureValues",
+                    "body": "*",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -3047,33 +1638,21 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1/{featurestore=projects/*/locations/*/featurestores/*}:batchReadFeatureValues",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_batch_read_feature_values(
                 request, metadata
             )
             pb_request = featurestore_service.BatchReadFeatureValuesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"], use_integers_for_enums=True
-            )
+            body = _message_to_json(transcoded_request["body"])
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3082,8 +1661,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.post(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -3097,25 +1676,24 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            _parse_json(response.content, resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_batch_read_feature_values(resp)
             return resp
 
     class _CreateEntityType(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("CreateEntityType")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {
+        _REQUIRED_FIELDS_DEFAULT_VALUES: ClassVar[Dict[str, Any]] = {
             "entityTypeId": "",
         }
 
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "post",
+                    "uri": "/v1/{parent=projects/*/locations/*/featurestores/*}/entityTypes",
+                    "body": "entity_type",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -3145,33 +1723,21 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1/{parent=projects/*/locations/*/featurestores/*}/entityTypes",
-                    "body": "entity_type",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_entity_type(
                 request, metadata
             )
             pb_request = featurestore_service.CreateEntityTypeRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"], use_integers_for_enums=True
-            )
+            body = _message_to_json(transcoded_request["body"])
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3180,8 +1746,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.post(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -3195,25 +1761,24 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            _parse_json(response.content, resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_create_entity_type(resp)
             return resp
 
     class _CreateFeature(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("CreateFeature")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {
+        _REQUIRED_FIELDS_DEFAULT_VALUES: ClassVar[Dict[str, Any]] = {
             "featureId": "",
         }
 
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "post",
+                    "uri": "/v1/{parent=projects/*/locations/*/featurestores/*/entityTypes/*}/features",
+                    "body": "feature",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -3245,31 +1810,19 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1/{parent=projects/*/locations/*/featurestores/*/entityTypes/*}/features",
-                    "body": "feature",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_feature(request, metadata)
             pb_request = featurestore_service.CreateFeatureRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"], use_integers_for_enums=True
-            )
+            body = _message_to_json(transcoded_request["body"])
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3278,8 +1831,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.post(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -3293,25 +1846,24 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            _parse_json(response.content, resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_create_feature(resp)
             return resp
 
     class _CreateFeaturestore(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("CreateFeaturestore")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {
+        _REQUIRED_FIELDS_DEFAULT_VALUES: ClassVar[Dict[str, Any]] = {
             "featurestoreId": "",
         }
 
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "post",
+                    "uri": "/v1/{parent=projects/*/locations/*}/featurestores",
+                    "body": "featurestore",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -3341,33 +1893,21 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1/{parent=projects/*/locations/*}/featurestores",
-                    "body": "featurestore",
-                },
-            ]
             request, metadata = self._interceptor.pre_create_featurestore(
                 request, metadata
             )
             pb_request = featurestore_service.CreateFeaturestoreRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"], use_integers_for_enums=True
-            )
+            body = _message_to_json(transcoded_request["body"])
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3376,8 +1916,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.post(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -3391,23 +1931,19 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            _parse_json(response.content, resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_create_featurestore(resp)
             return resp
 
     class _DeleteEntityType(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("DeleteEntityType")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "delete",
+                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*}",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -3437,27 +1973,18 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_entity_type(
                 request, metadata
             )
             pb_request = featurestore_service.DeleteEntityTypeRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3466,8 +1993,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.delete(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -3480,23 +2007,19 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            _parse_json(response.content, resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete_entity_type(resp)
             return resp
 
     class _DeleteFeature(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("DeleteFeature")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "delete",
+                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*}",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -3528,25 +2051,16 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_feature(request, metadata)
             pb_request = featurestore_service.DeleteFeatureRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3555,8 +2069,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.delete(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -3569,23 +2083,19 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            _parse_json(response.content, resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete_feature(resp)
             return resp
 
     class _DeleteFeaturestore(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("DeleteFeaturestore")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "delete",
+                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*}",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -3615,27 +2125,18 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_featurestore(
                 request, metadata
             )
             pb_request = featurestore_service.DeleteFeaturestoreRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3644,8 +2145,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.delete(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -3658,23 +2159,20 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            _parse_json(response.content, resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete_featurestore(resp)
             return resp
 
     class _DeleteFeatureValues(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("DeleteFeatureValues")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "post",
+                    "uri": "/v1/{entity_type=projects/*/locations/*/featurestores/*/entityTypes/*}:deleteFeatureValues",
+                    "body": "*",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -3704,33 +2202,21 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1/{entity_type=projects/*/locations/*/featurestores/*/entityTypes/*}:deleteFeatureValues",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_delete_feature_values(
                 request, metadata
             )
             pb_request = featurestore_service.DeleteFeatureValuesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"], use_integers_for_enums=True
-            )
+            body = _message_to_json(transcoded_request["body"])
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3739,8 +2225,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.post(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -3754,23 +2240,20 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            _parse_json(response.content, resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_delete_feature_values(resp)
             return resp
 
     class _ExportFeatureValues(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("ExportFeatureValues")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "post",
+                    "uri": "/v1/{entity_type=projects/*/locations/*/featurestores/*/entityTypes/*}:exportFeatureValues",
+                    "body": "*",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -3800,33 +2283,21 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1/{entity_type=projects/*/locations/*/featurestores/*/entityTypes/*}:exportFeatureValues",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_export_feature_values(
                 request, metadata
             )
             pb_request = featurestore_service.ExportFeatureValuesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"], use_integers_for_enums=True
-            )
+            body = _message_to_json(transcoded_request["body"])
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3835,8 +2306,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.post(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -3850,23 +2321,19 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            _parse_json(response.content, resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_export_feature_values(resp)
             return resp
 
     class _GetEntityType(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("GetEntityType")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "get",
+                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*}",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -3899,25 +2366,16 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_entity_type(request, metadata)
             pb_request = featurestore_service.GetEntityTypeRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -3926,8 +2384,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.get(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -3942,23 +2400,19 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             resp = entity_type.EntityType()
             pb_resp = entity_type.EntityType.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            _parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_entity_type(resp)
             return resp
 
     class _GetFeature(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("GetFeature")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "get",
+                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*}",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -3990,25 +2444,16 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_feature(request, metadata)
             pb_request = featurestore_service.GetFeatureRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4017,8 +2462,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.get(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -4033,23 +2478,19 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             resp = feature.Feature()
             pb_resp = feature.Feature.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            _parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_feature(resp)
             return resp
 
     class _GetFeaturestore(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("GetFeaturestore")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "get",
+                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*}",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -4081,27 +2522,18 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*}",
-                },
-            ]
             request, metadata = self._interceptor.pre_get_featurestore(
                 request, metadata
             )
             pb_request = featurestore_service.GetFeaturestoreRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4110,8 +2542,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.get(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -4126,23 +2558,20 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             resp = featurestore.Featurestore()
             pb_resp = featurestore.Featurestore.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            _parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_get_featurestore(resp)
             return resp
 
     class _ImportFeatureValues(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("ImportFeatureValues")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "post",
+                    "uri": "/v1/{entity_type=projects/*/locations/*/featurestores/*/entityTypes/*}:importFeatureValues",
+                    "body": "*",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -4172,33 +2601,21 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/v1/{entity_type=projects/*/locations/*/featurestores/*/entityTypes/*}:importFeatureValues",
-                    "body": "*",
-                },
-            ]
             request, metadata = self._interceptor.pre_import_feature_values(
                 request, metadata
             )
             pb_request = featurestore_service.ImportFeatureValuesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"], use_integers_for_enums=True
-            )
+            body = _message_to_json(transcoded_request["body"])
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4207,8 +2624,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.post(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -4222,23 +2639,19 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            _parse_json(response.content, resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_import_feature_values(resp)
             return resp
 
     class _ListEntityTypes(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("ListEntityTypes")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "get",
+                    "uri": "/v1/{parent=projects/*/locations/*/featurestores/*}/entityTypes",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -4267,27 +2680,18 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1/{parent=projects/*/locations/*/featurestores/*}/entityTypes",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_entity_types(
                 request, metadata
             )
             pb_request = featurestore_service.ListEntityTypesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4296,8 +2700,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.get(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -4312,23 +2716,19 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             resp = featurestore_service.ListEntityTypesResponse()
             pb_resp = featurestore_service.ListEntityTypesResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            _parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list_entity_types(resp)
             return resp
 
     class _ListFeatures(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("ListFeatures")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "get",
+                    "uri": "/v1/{parent=projects/*/locations/*/featurestores/*/entityTypes/*}/features",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -4361,25 +2761,16 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1/{parent=projects/*/locations/*/featurestores/*/entityTypes/*}/features",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_features(request, metadata)
             pb_request = featurestore_service.ListFeaturesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4388,8 +2779,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.get(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -4404,23 +2795,19 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             resp = featurestore_service.ListFeaturesResponse()
             pb_resp = featurestore_service.ListFeaturesResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            _parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list_features(resp)
             return resp
 
     class _ListFeaturestores(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("ListFeaturestores")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "get",
+                    "uri": "/v1/{parent=projects/*/locations/*}/featurestores",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -4449,27 +2836,18 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1/{parent=projects/*/locations/*}/featurestores",
-                },
-            ]
             request, metadata = self._interceptor.pre_list_featurestores(
                 request, metadata
             )
             pb_request = featurestore_service.ListFeaturestoresRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4478,8 +2856,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.get(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -4494,23 +2872,19 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             resp = featurestore_service.ListFeaturestoresResponse()
             pb_resp = featurestore_service.ListFeaturestoresResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            _parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_list_featurestores(resp)
             return resp
 
     class _SearchFeatures(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("SearchFeatures")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "get",
+                    "uri": "/v1/{location=projects/*/locations/*}/featurestores:searchFeatures",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -4539,25 +2913,16 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/v1/{location=projects/*/locations/*}/featurestores:searchFeatures",
-                },
-            ]
             request, metadata = self._interceptor.pre_search_features(request, metadata)
             pb_request = featurestore_service.SearchFeaturesRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4566,8 +2931,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.get(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -4582,23 +2947,20 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             resp = featurestore_service.SearchFeaturesResponse()
             pb_resp = featurestore_service.SearchFeaturesResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            _parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_search_features(resp)
             return resp
 
     class _UpdateEntityType(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("UpdateEntityType")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "patch",
+                    "uri": "/v1/{entity_type.name=projects/*/locations/*/featurestores/*/entityTypes/*}",
+                    "body": "entity_type",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -4631,33 +2993,21 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1/{entity_type.name=projects/*/locations/*/featurestores/*/entityTypes/*}",
-                    "body": "entity_type",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_entity_type(
                 request, metadata
             )
             pb_request = featurestore_service.UpdateEntityTypeRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"], use_integers_for_enums=True
-            )
+            body = _message_to_json(transcoded_request["body"])
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4666,8 +3016,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.patch(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -4683,23 +3033,20 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             resp = gca_entity_type.EntityType()
             pb_resp = gca_entity_type.EntityType.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            _parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_update_entity_type(resp)
             return resp
 
     class _UpdateFeature(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("UpdateFeature")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "patch",
+                    "uri": "/v1/{feature.name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*}",
+                    "body": "feature",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -4731,31 +3078,19 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1/{feature.name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*}",
-                    "body": "feature",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_feature(request, metadata)
             pb_request = featurestore_service.UpdateFeatureRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"], use_integers_for_enums=True
-            )
+            body = _message_to_json(transcoded_request["body"])
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4764,8 +3099,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.patch(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -4781,23 +3116,20 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             resp = gca_feature.Feature()
             pb_resp = gca_feature.Feature.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            _parse_json(response.content, pb_resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_update_feature(resp)
             return resp
 
     class _UpdateFeaturestore(FeaturestoreServiceRestStub):
-        def __hash__(self):
-            return hash("UpdateFeaturestore")
-
-        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
-
-        @classmethod
-        def _get_unset_required_fields(cls, message_dict):
-            return {
-                k: v
-                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
-                if k not in message_dict
-            }
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {
+                    "method": "patch",
+                    "uri": "/v1/{featurestore.name=projects/*/locations/*/featurestores/*}",
+                    "body": "featurestore",
+                }
+            ),
+        )
 
         def __call__(
             self,
@@ -4827,33 +3159,21 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "patch",
-                    "uri": "/v1/{featurestore.name=projects/*/locations/*/featurestores/*}",
-                    "body": "featurestore",
-                },
-            ]
             request, metadata = self._interceptor.pre_update_featurestore(
                 request, metadata
             )
             pb_request = featurestore_service.UpdateFeaturestoreRequest.pb(request)
-            transcoded_request = path_template.transcode(http_options, pb_request)
+            transcoded_request = path_template.transcode(self._HTTP_OPTIONS, pb_request)
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"], use_integers_for_enums=True
-            )
+            body = _message_to_json(transcoded_request["body"])
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    use_integers_for_enums=True,
-                )
+            query_params = json_format.MessageToDict(
+                transcoded_request["query_params"],
+                use_integers_for_enums=True,
             )
             query_params.update(self._get_unset_required_fields(query_params))
 
@@ -4862,8 +3182,8 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.patch(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params, strict=True),
@@ -4877,7 +3197,7 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            _parse_json(response.content, resp, ignore_unknown_fields=True)
             resp = self._interceptor.post_update_featurestore(resp)
             return resp
 
@@ -5094,6 +3414,15 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
         return self._GetLocation(self._session, self._host, self._interceptor)  # type: ignore
 
     class _GetLocation(FeaturestoreServiceRestStub):
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {"method": "get", "uri": "/ui/{name=projects/*/locations/*}"}
+            ),
+            MappingProxyType(
+                {"method": "get", "uri": "/v1/{name=projects/*/locations/*}"}
+            ),
+        )
+
         def __call__(
             self,
             request: locations_pb2.GetLocationRequest,
@@ -5118,33 +3447,23 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
                 locations_pb2.Location: Response from GetLocation method.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*}",
-                },
-            ]
-
             request, metadata = self._interceptor.pre_get_location(request, metadata)
             request_kwargs = json_format.MessageToDict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
+            transcoded_request = path_template.transcode(
+                self._HTTP_OPTIONS, **request_kwargs
+            )
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(json.dumps(transcoded_request["query_params"]))
+            query_params = transcoded_request["query_params"]
 
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
 
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.get(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params),
@@ -5156,7 +3475,7 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
                 raise core_exceptions.from_http_response(response)
 
             resp = locations_pb2.Location()
-            resp = json_format.Parse(response.content.decode("utf-8"), resp)
+            resp = _parse_json(response.content, resp)
             resp = self._interceptor.post_get_location(resp)
             return resp
 
@@ -5165,6 +3484,15 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
         return self._ListLocations(self._session, self._host, self._interceptor)  # type: ignore
 
     class _ListLocations(FeaturestoreServiceRestStub):
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
+                {"method": "get", "uri": "/ui/{name=projects/*}/locations"}
+            ),
+            MappingProxyType(
+                {"method": "get", "uri": "/v1/{name=projects/*}/locations"}
+            ),
+        )
+
         def __call__(
             self,
             request: locations_pb2.ListLocationsRequest,
@@ -5189,33 +3517,23 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
                 locations_pb2.ListLocationsResponse: Response from ListLocations method.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*}/locations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*}/locations",
-                },
-            ]
-
             request, metadata = self._interceptor.pre_list_locations(request, metadata)
             request_kwargs = json_format.MessageToDict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
+            transcoded_request = path_template.transcode(
+                self._HTTP_OPTIONS, **request_kwargs
+            )
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(json.dumps(transcoded_request["query_params"]))
+            query_params = transcoded_request["query_params"]
 
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
 
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.get(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params),
@@ -5227,7 +3545,7 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
                 raise core_exceptions.from_http_response(response)
 
             resp = locations_pb2.ListLocationsResponse()
-            resp = json_format.Parse(response.content.decode("utf-8"), resp)
+            resp = _parse_json(response.content, resp)
             resp = self._interceptor.post_list_locations(resp)
             return resp
 
@@ -5236,105 +3554,134 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
         return self._GetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
 
     class _GetIamPolicy(FeaturestoreServiceRestStub):
-        def __call__(
-            self,
-            request: iam_policy_pb2.GetIamPolicyRequest,
-            *,
-            retry: OptionalRetry = gapic_v1.method.DEFAULT,
-            timeout: Optional[float] = None,
-            metadata: Sequence[Tuple[str, str]] = (),
-        ) -> policy_pb2.Policy:
-
-            r"""Call the get iam policy method over HTTP.
-
-            Args:
-                request (iam_policy_pb2.GetIamPolicyRequest):
-                    The request object for GetIamPolicy method.
-                retry (google.api_core.retry.Retry): Designation of what errors, if any,
-                    should be retried.
-                timeout (float): The timeout for this request.
-                metadata (Sequence[Tuple[str, str]]): Strings which should be
-                    sent along with the request as metadata.
-
-            Returns:
-                policy_pb2.Policy: Response from GetIamPolicy method.
-            """
-
-            http_options: List[Dict[str, str]] = [
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/featurestores/*}:getIamPolicy",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/featurestores/*/entityTypes/*}:getIamPolicy",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/models/*}:getIamPolicy",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/notebookRuntimeTemplates/*}:getIamPolicy",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/featureOnlineStores/*}:getIamPolicy",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/featureOnlineStores/*/featureViews/*}:getIamPolicy",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/featurestores/*}:getIamPolicy",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/featurestores/*/entityTypes/*}:getIamPolicy",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/models/*}:getIamPolicy",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/endpoints/*}:getIamPolicy",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/notebookRuntimeTemplates/*}:getIamPolicy",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/publishers/*/models/*}:getIamPolicy",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/featureOnlineStores/*}:getIamPolicy",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/featureOnlineStores/*/featureViews/*}:getIamPolicy",
-                },
-            ]
+                }
+            ),
+        )
+
+        def __call__(
+            self,
+            request: iam_policy_pb2.GetIamPolicyRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: Optional[float] = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+        ) -> policy_pb2.Policy:
+
+            r"""Call the get iam policy method over HTTP.
+
+            Args:
+                request (iam_policy_pb2.GetIamPolicyRequest):
+                    The request object for GetIamPolicy method.
+                retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+
+            Returns:
+                policy_pb2.Policy: Response from GetIamPolicy method.
+            """
 
             request, metadata = self._interceptor.pre_get_iam_policy(request, metadata)
             request_kwargs = json_format.MessageToDict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
+            transcoded_request = path_template.transcode(
+                self._HTTP_OPTIONS, **request_kwargs
+            )
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(json.dumps(transcoded_request["query_params"]))
+            query_params = transcoded_request["query_params"]
 
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
 
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.post(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params),
@@ -5346,7 +3693,7 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
                 raise core_exceptions.from_http_response(response)
 
             resp = policy_pb2.Policy()
-            resp = json_format.Parse(response.content.decode("utf-8"), resp)
+            resp = _parse_json(response.content, resp)
             resp = self._interceptor.post_get_iam_policy(resp)
             return resp
 
@@ -5355,115 +3702,142 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
         return self._SetIamPolicy(self._session, self._host, self._interceptor)  # type: ignore
 
     class _SetIamPolicy(FeaturestoreServiceRestStub):
-        def __call__(
-            self,
-            request: iam_policy_pb2.SetIamPolicyRequest,
-            *,
-            retry: OptionalRetry = gapic_v1.method.DEFAULT,
-            timeout: Optional[float] = None,
-            metadata: Sequence[Tuple[str, str]] = (),
-        ) -> policy_pb2.Policy:
-
-            r"""Call the set iam policy method over HTTP.
-
-            Args:
-                request (iam_policy_pb2.SetIamPolicyRequest):
-                    The request object for SetIamPolicy method.
-                retry (google.api_core.retry.Retry): Designation of what errors, if any,
-                    should be retried.
-                timeout (float): The timeout for this request.
-                metadata (Sequence[Tuple[str, str]]): Strings which should be
-                    sent along with the request as metadata.
-
-            Returns:
-                policy_pb2.Policy: Response from SetIamPolicy method.
-            """
-
-            http_options: List[Dict[str, str]] = [
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/featurestores/*}:setIamPolicy",
                     "body": "*",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/featurestores/*/entityTypes/*}:setIamPolicy",
                     "body": "*",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/models/*}:setIamPolicy",
                     "body": "*",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/notebookRuntimeTemplates/*}:setIamPolicy",
                     "body": "*",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/featureOnlineStores/*}:setIamPolicy",
                     "body": "*",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/featureOnlineStores/*/featureViews/*}:setIamPolicy",
                     "body": "*",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/featurestores/*}:setIamPolicy",
                     "body": "*",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/featurestores/*/entityTypes/*}:setIamPolicy",
                     "body": "*",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/models/*}:setIamPolicy",
                     "body": "*",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/endpoints/*}:setIamPolicy",
                     "body": "*",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/notebookRuntimeTemplates/*}:setIamPolicy",
                     "body": "*",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/featureOnlineStores/*}:setIamPolicy",
                     "body": "*",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/featureOnlineStores/*/featureViews/*}:setIamPolicy",
                     "body": "*",
-                },
-            ]
+                }
+            ),
+        )
+
+        def __call__(
+            self,
+            request: iam_policy_pb2.SetIamPolicyRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: Optional[float] = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+        ) -> policy_pb2.Policy:
+
+            r"""Call the set iam policy method over HTTP.
+
+            Args:
+                request (iam_policy_pb2.SetIamPolicyRequest):
+                    The request object for SetIamPolicy method.
+                retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+
+            Returns:
+                policy_pb2.Policy: Response from SetIamPolicy method.
+            """
 
             request, metadata = self._interceptor.pre_set_iam_policy(request, metadata)
             request_kwargs = json_format.MessageToDict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
+            transcoded_request = path_template.transcode(
+                self._HTTP_OPTIONS, **request_kwargs
+            )
 
-            body = json.dumps(transcoded_request["body"])
+            body = json.dumps(transcoded_request["body"]).encode("utf-8")
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(json.dumps(transcoded_request["query_params"]))
+            query_params = transcoded_request["query_params"]
 
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
 
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.post(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params),
@@ -5476,7 +3850,7 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
                 raise core_exceptions.from_http_response(response)
 
             resp = policy_pb2.Policy()
-            resp = json_format.Parse(response.content.decode("utf-8"), resp)
+            resp = _parse_json(response.content, resp)
             resp = self._interceptor.post_set_iam_policy(resp)
             return resp
 
@@ -5485,103 +3859,130 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
         return self._TestIamPermissions(self._session, self._host, self._interceptor)  # type: ignore
 
     class _TestIamPermissions(FeaturestoreServiceRestStub):
-        def __call__(
-            self,
-            request: iam_policy_pb2.TestIamPermissionsRequest,
-            *,
-            retry: OptionalRetry = gapic_v1.method.DEFAULT,
-            timeout: Optional[float] = None,
-            metadata: Sequence[Tuple[str, str]] = (),
-        ) -> iam_policy_pb2.TestIamPermissionsResponse:
-
-            r"""Call the test iam permissions method over HTTP.
-
-            Args:
-                request (iam_policy_pb2.TestIamPermissionsRequest):
-                    The request object for TestIamPermissions method.
-                retry (google.api_core.retry.Retry): Designation of what errors, if any,
-                    should be retried.
-                timeout (float): The timeout for this request.
-                metadata (Sequence[Tuple[str, str]]): Strings which should be
-                    sent along with the request as metadata.
-
-            Returns:
-                iam_policy_pb2.TestIamPermissionsResponse: Response from TestIamPermissions method.
-            """
-
-            http_options: List[Dict[str, str]] = [
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = (
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/featurestores/*}:testIamPermissions",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/featurestores/*/entityTypes/*}:testIamPermissions",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/models/*}:testIamPermissions",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/notebookRuntimeTemplates/*}:testIamPermissions",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/featureOnlineStores/*}:testIamPermissions",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/v1/{resource=projects/*/locations/*/featureOnlineStores/*/featureViews/*}:testIamPermissions",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/featurestores/*}:testIamPermissions",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/featurestores/*/entityTypes/*}:testIamPermissions",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/models/*}:testIamPermissions",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/endpoints/*}:testIamPermissions",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/notebookRuntimeTemplates/*}:testIamPermissions",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/featureOnlineStores/*}:testIamPermissions",
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "method": "post",
                     "uri": "/ui/{resource=projects/*/locations/*/featureOnlineStores/*/featureViews/*}:testIamPermissions",
-                },
-            ]
+                }
+            ),
+        )
+
+        def __call__(
+            self,
+            request: iam_policy_pb2.TestIamPermissionsRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: Optional[float] = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+        ) -> iam_policy_pb2.TestIamPermissionsResponse:
+
+            r"""Call the test iam permissions method over HTTP.
+
+            Args:
+                request (iam_policy_pb2.TestIamPermissionsRequest):
+                    The request object for TestIamPermissions method.
+                retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+
+            Returns:
+                iam_policy_pb2.TestIamPermissionsResponse: Response from TestIamPermissions method.
+            """
 
             request, metadata = self._interceptor.pre_test_iam_permissions(
                 request, metadata
             )
             request_kwargs = json_format.MessageToDict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
+            transcoded_request = path_template.transcode(
+                self._HTTP_OPTIONS, **request_kwargs
+            )
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(json.dumps(transcoded_request["query_params"]))
+            query_params = transcoded_request["query_params"]
 
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
 
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.post(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params),
@@ -5593,7 +3994,7 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
                 raise core_exceptions.from_http_response(response)
 
             resp = iam_policy_pb2.TestIamPermissionsResponse()
-            resp = json_format.Parse(response.content.decode("utf-8"), resp)
+            resp = _parse_json(response.content, resp)
             resp = self._interceptor.post_test_iam_permissions(resp)
             return resp
 
@@ -5602,6 +4003,10 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
         return self._CancelOperation(self._session, self._host, self._interceptor)  # type: ignore
 
     class _CancelOperation(FeaturestoreServiceRestStub):
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = _OPERATIONS_HTTP_OPTIONS[
+            "google.longrunning.Operations.CancelOperation"
+        ]
+
         def __call__(
             self,
             request: operations_pb2.CancelOperationRequest,
@@ -5623,363 +4028,24 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/agents/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/apps/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/edgeDevices/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/endpoints/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/extensionControllers/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/extensions/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/customJobs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/tuningJobs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/indexes/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/indexEndpoints/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/modelMonitors/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/migratableResources/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/models/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/persistentResources/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/studies/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/studies/*/trials/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/trainingPipelines/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/pipelineJobs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/schedules/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/specialistPools/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/endpoints/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/customJobs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/tuningJobs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/indexes/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/indexEndpoints/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/migratableResources/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/models/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/persistentResources/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/studies/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/studies/*/trials/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/trainingPipelines/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/pipelineJobs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/schedules/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/specialistPools/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}:cancel",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}:cancel",
-                },
-            ]
-
             request, metadata = self._interceptor.pre_cancel_operation(
                 request, metadata
             )
             request_kwargs = json_format.MessageToDict(request)
+            http_options = _select_http_options(type(self), request.name)
             transcoded_request = path_template.transcode(http_options, **request_kwargs)
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(json.dumps(transcoded_request["query_params"]))
+            query_params = transcoded_request["query_params"]
 
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
 
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.post(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params),
@@ -5997,6 +4063,10 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
         return self._DeleteOperation(self._session, self._host, self._interceptor)  # type: ignore
 
     class _DeleteOperation(FeaturestoreServiceRestStub):
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = _OPERATIONS_HTTP_OPTIONS[
+            "google.longrunning.Operations.DeleteOperation"
+        ]
+
         def __call__(
             self,
             request: operations_pb2.DeleteOperationRequest,
@@ -6018,387 +4088,24 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
                     sent along with the request as metadata.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/agents/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/apps/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/edgeDevices/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/endpoints/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/extensionControllers/*}/operations",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/extensions/*}/operations",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/customJobs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/indexes/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/indexEndpoints/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/modelMonitors/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/migratableResources/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/models/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/persistentResources/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/studies/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/studies/*/trials/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/trainingPipelines/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/pipelineJobs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/schedules/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/specialistPools/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/endpoints/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/customJobs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/indexes/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/indexEndpoints/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/migratableResources/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/models/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/studies/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/studies/*/trials/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/trainingPipelines/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/persistentResources/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/pipelineJobs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/schedules/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/specialistPools/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}",
-                },
-                {
-                    "method": "delete",
-                    "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}",
-                },
-            ]
-
             request, metadata = self._interceptor.pre_delete_operation(
                 request, metadata
             )
             request_kwargs = json_format.MessageToDict(request)
+            http_options = _select_http_options(type(self), request.name)
             transcoded_request = path_template.transcode(http_options, **request_kwargs)
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(json.dumps(transcoded_request["query_params"]))
+            query_params = transcoded_request["query_params"]
 
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
 
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.delete(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params),
@@ -6416,852 +4123,114 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
         return self._GetOperation(self._session, self._host, self._interceptor)  # type: ignore
 
     class _GetOperation(FeaturestoreServiceRestStub):
-        def __call__(
-            self,
-            request: operations_pb2.GetOperationRequest,
-            *,
-            retry: OptionalRetry = gapic_v1.method.DEFAULT,
-            timeout: Optional[float] = None,
-            metadata: Sequence[Tuple[str, str]] = (),
-        ) -> operations_pb2.Operation:
-
-            r"""Call the get operation method over HTTP.
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = _OPERATIONS_HTTP_OPTIONS[
+            "google.longrunning.Operations.GetOperation"
+        ]
 
-            Args:
-                request (operations_pb2.GetOperationRequest):
-                    The request object for GetOperation method.
-                retry (google.api_core.retry.Retry): Designation of what errors, if any,
-                    should be retried.
-                timeout (float): The timeout for this request.
-                metadata (Sequence[Tuple[str, str]]): Strings which should be
-                    sent along with the request as metadata.
-
-            Returns:
-                operations_pb2.Operation: Response from GetOperation method.
-            """
-
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/agents/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/apps/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/edgeDeploymentJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/edgeDevices/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/endpoints/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/extensionControllers/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/extensions/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/customJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/tuningJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/indexes/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/indexEndpoints/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/modelMonitors/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/migratableResources/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/models/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/persistentResources/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/studies/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/studies/*/trials/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/trainingPipelines/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/pipelineJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/schedules/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/specialistPools/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/endpoints/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/customJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/tuningJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/indexes/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/indexEndpoints/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/migratableResources/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/models/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/studies/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/studies/*/trials/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/trainingPipelines/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/persistentResources/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/pipelineJobs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/schedules/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/specialistPools/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/operations/*}",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}",
-                },
-            ]
-
-            request, metadata = self._interceptor.pre_get_operation(request, metadata)
-            request_kwargs = json_format.MessageToDict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(json.dumps(transcoded_request["query_params"]))
-
-            # Send the request
-            headers = dict(metadata)
-            headers["Content-Type"] = "application/json"
-
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
-                timeout=timeout,
-                headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
-            )
-
-            # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
-            # subclass.
-            if response.status_code >= 400:
-                raise core_exceptions.from_http_response(response)
-
-            resp = operations_pb2.Operation()
-            resp = json_format.Parse(response.content.decode("utf-8"), resp)
-            resp = self._interceptor.post_get_operation(resp)
-            return resp
-
-    @property
-    def list_operations(self):
-        return self._ListOperations(self._session, self._host, self._interceptor)  # type: ignore
-
-    class _ListOperations(FeaturestoreServiceRestStub):
         def __call__(
             self,
-            request: operations_pb2.ListOperationsRequest,
+            request: operations_pb2.GetOperationRequest,
             *,
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: Optional[float] = None,
             metadata: Sequence[Tuple[str, str]] = (),
-        ) -> operations_pb2.ListOperationsResponse:
-
-            r"""Call the list operations method over HTTP.
-
-            Args:
-                request (operations_pb2.ListOperationsRequest):
-                    The request object for ListOperations method.
-                retry (google.api_core.retry.Retry): Designation of what errors, if any,
-                    should be retried.
-                timeout (float): The timeout for this request.
-                metadata (Sequence[Tuple[str, str]]): Strings which should be
-                    sent along with the request as metadata.
-
-            Returns:
-                operations_pb2.ListOperationsResponse: Response from ListOperations method.
-            """
-
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/agents/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/apps/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/savedQueries/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/annotationSpecs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/deploymentResourcePools/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/edgeDevices/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/endpoints/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/extensionControllers/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/extensions/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/customJobs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/dataLabelingJobs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/hyperparameterTuningJobs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/tuningJobs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/indexes/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/indexEndpoints/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/artifacts/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/contexts/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/executions/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/modelMonitors/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/migratableResources/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/models/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/models/*/evaluations/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookExecutionJobs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookRuntimes/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookRuntimeTemplates/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/studies/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/studies/*/trials/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/trainingPipelines/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/persistentResources/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/pipelineJobs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/schedules/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/specialistPools/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}:wait",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}:wait",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/operations/*}:wait",
-                },
-                {
-                    "method": "get",
-                    "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}:wait",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/savedQueries/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/annotationSpecs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/deploymentResourcePools/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/endpoints/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/customJobs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/dataLabelingJobs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/hyperparameterTuningJobs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/tuningJobs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/indexes/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/indexEndpoints/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/artifacts/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/contexts/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/executions/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/migratableResources/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/models/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/models/*/evaluations/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookExecutionJobs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookRuntimes/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookRuntimeTemplates/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/studies/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/studies/*/trials/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/trainingPipelines/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/persistentResources/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/pipelineJobs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/schedules/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/specialistPools/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*}/operations",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}:wait",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}:wait",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/operations/*}:wait",
-                },
-                {
-                    "method": "get",
-                    "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}:wait",
-                },
-            ]
+        ) -> operations_pb2.Operation:
+
+            r"""Call the get operation method over HTTP.
+
+            Args:
+                request (operations_pb2.GetOperationRequest):
+                    The request object for GetOperation method.
+                retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+
+            Returns:
+                operations_pb2.Operation: Response from GetOperation method.
+            """
+
+            request, metadata = self._interceptor.pre_get_operation(request, metadata)
+            request_kwargs = json_format.MessageToDict(request)
+            http_options = _select_http_options(type(self), request.name)
+            transcoded_request = path_template.transcode(http_options, **request_kwargs)
+
+            uri = transcoded_request["uri"]
+
+            # Jsonify the query params
+            query_params = transcoded_request["query_params"]
+
+            # Send the request
+            headers = dict(metadata)
+            headers["Content-Type"] = "application/json"
+
+            response = self._session.get(
+                f"{self._host}{uri}",
+                timeout=timeout,
+                headers=headers,
+                params=rest_helpers.flatten_query_params(query_params),
+            )
+
+            # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
+            # subclass.
+            if response.status_code >= 400:
+                raise core_exceptions.from_http_response(response)
+
+            resp = operations_pb2.Operation()
+            resp = _parse_json(response.content, resp)
+            resp = self._interceptor.post_get_operation(resp)
+            return resp
+
+    @property
+    def list_operations(self):
+        return self._ListOperations(self._session, self._host, self._interceptor)  # type: ignore
+
+    class _ListOperations(FeaturestoreServiceRestStub):
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = _OPERATIONS_HTTP_OPTIONS[
+            "google.longrunning.Operations.ListOperations"
+        ]
+
+        def __call__(
+            self,
+            request: operations_pb2.ListOperationsRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: Optional[float] = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+        ) -> operations_pb2.ListOperationsResponse:
+
+            r"""Call the list operations method over HTTP.
+
+            Args:
+                request (operations_pb2.ListOperationsRequest):
+                    The request object for ListOperations method.
+                retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+
+            Returns:
+                operations_pb2.ListOperationsResponse: Response from ListOperations method.
+            """
 
             request, metadata = self._interceptor.pre_list_operations(request, metadata)
             request_kwargs = json_format.MessageToDict(request)
+            http_options = _select_http_options(type(self), request.name)
             transcoded_request = path_template.transcode(http_options, **request_kwargs)
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(json.dumps(transcoded_request["query_params"]))
+            query_params = transcoded_request["query_params"]
 
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
 
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.get(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params),
@@ -7273,7 +4242,7 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
                 raise core_exceptions.from_http_response(response)
 
             resp = operations_pb2.ListOperationsResponse()
-            resp = json_format.Parse(response.content.decode("utf-8"), resp)
+            resp = _parse_json(response.content, resp)
             resp = self._interceptor.post_list_operations(resp)
             return resp
 
@@ -7282,6 +4251,10 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
         return self._WaitOperation(self._session, self._host, self._interceptor)  # type: ignore
 
     class _WaitOperation(FeaturestoreServiceRestStub):
+        _HTTP_OPTIONS: Tuple[Mapping[str, str], ...] = _OPERATIONS_HTTP_OPTIONS[
+            "google.longrunning.Operations.WaitOperation"
+        ]
+
         def __call__(
             self,
             request: operations_pb2.WaitOperationRequest,
@@ -7306,389 +4279,22 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
                 operations_pb2.Operation: Response from WaitOperation method.
             """
 
-            http_options: List[Dict[str, str]] = [
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/agents/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/apps/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/edgeDevices/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/endpoints/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/extensionControllers/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/extensions/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/customJobs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/tuningJobs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/indexes/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/indexEndpoints/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/modelMonitors/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/migratableResources/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/models/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/studies/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/studies/*/trials/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/trainingPipelines/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/persistentResources/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/pipelineJobs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/schedules/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/specialistPools/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/ui/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/savedQueries/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/annotationSpecs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/datasets/*/dataItems/*/annotations/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/deploymentResourcePools/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/endpoints/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/featurestores/*/entityTypes/*/features/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/customJobs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/dataLabelingJobs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/hyperparameterTuningJobs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/indexes/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/indexEndpoints/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/artifacts/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/contexts/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/metadataStores/*/executions/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/modelDeploymentMonitoringJobs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/migratableResources/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/models/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/models/*/evaluations/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookExecutionJobs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookRuntimes/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/notebookRuntimeTemplates/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/studies/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/studies/*/trials/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/trainingPipelines/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/persistentResources/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/pipelineJobs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/schedules/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/specialistPools/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/tensorboards/*/experiments/*/runs/*/timeSeries/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/featureOnlineStores/*/featureViews/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/operations/*}:wait",
-                },
-                {
-                    "method": "post",
-                    "uri": "/v1/{name=projects/*/locations/*/featureGroups/*/features/*/operations/*}:wait",
-                },
-            ]
-
             request, metadata = self._interceptor.pre_wait_operation(request, metadata)
             request_kwargs = json_format.MessageToDict(request)
+            http_options = _select_http_options(type(self), request.name)
             transcoded_request = path_template.transcode(http_options, **request_kwargs)
 
             uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(json.dumps(transcoded_request["query_params"]))
+            query_params = transcoded_request["query_params"]
 
             # Send the request
             headers = dict(metadata)
             headers["Content-Type"] = "application/json"
 
-            response = getattr(self._session, method)(
-                "{host}{uri}".format(host=self._host, uri=uri),
+            response = self._session.post(
+                f"{self._host}{uri}",
                 timeout=timeout,
                 headers=headers,
                 params=rest_helpers.flatten_query_params(query_params),
@@ -7700,7 +4306,7 @@ class FeaturestoreServiceRestTransport(FeaturestoreServiceTransport):
                 raise core_exceptions.from_http_response(response)
 
             resp = operations_pb2.Operation()
-            resp = json_format.Parse(response.content.decode("utf-8"), resp)
+            resp = _parse_json(response.content, resp)
             resp = self._interceptor.post_wait_operation(resp)
             return resp
 
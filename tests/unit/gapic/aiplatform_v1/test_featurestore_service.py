@@ -17682,6 +17682,98 @@ def test_search_features_rest_interceptors(null_interceptor):
         post.assert_called_once()
 
 
+def test_search_features_rest_interceptor_subclass():
+    class Interceptor(transports.FeaturestoreServiceRestInterceptor):
+        def pre_search_features(self, request, metadata):
+            request.query = "overridden"
+            return request, metadata
+
+        def post_search_features(self, response):
+            response.next_page_token = "from_interceptor"
+            return response
+
+    transport = transports.FeaturestoreServiceRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+        interceptor=Interceptor(),
+    )
+    client = FeaturestoreServiceClient(transport=transport)
+    with mock.patch.object(Session, "request") as req:
+        req.return_value = Response()
+        req.return_value.status_code = 200
+        req.return_value.request = PreparedRequest()
+        req.return_value._content = featurestore_service.SearchFeaturesResponse.to_json(
+            featurestore_service.SearchFeaturesResponse()
+        )
+
+        response = client.search_features(
+            request={"location": "projects/sample1/locations/sample2"}
+        )
+
+        _, kwargs = req.call_args
+        assert ("query", "overridden") in kwargs["params"]
+        assert response.next_page_token == "from_interceptor"
+
+
+def test_search_features_rest_interceptor_instance_override():
+    class Interceptor(transports.FeaturestoreServiceRestInterceptor):
+        pass
+
+    def pre_search_features(request, metadata):
+        request.query = "overridden"
+        return request, metadata
+
+    interceptor = Interceptor()
+    interceptor.pre_search_features = pre_search_features
+    transport = transports.FeaturestoreServiceRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+        interceptor=interceptor,
+    )
+    client = FeaturestoreServiceClient(transport=transport)
+    with mock.patch.object(Session, "request") as req, mock.patch.object(
+        transport._interceptor,
+        "post_search_features",
+        side_effect=lambda response: response,
+    ) as post:
+        req.return_value = Response()
+        req.return_value.status_code = 200
+        req.return_value.request = PreparedRequest()
+        req.return_value._content = featurestore_service.SearchFeaturesResponse.to_json(
+            featurestore_service.SearchFeaturesResponse()
+        )
+
+        client.search_features(
+            request={"location": "projects/sample1/locations/sample2"}
+        )
+
+        _, kwargs = req.call_args
+        assert ("query", "overridden") in kwargs["params"]
+        post.assert_called_once()
+
+
+def test_search_features_rest_default_interceptor_instance_override():
+    transport = transports.FeaturestoreServiceRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    client = FeaturestoreServiceClient(transport=transport)
+    with mock.patch.object(Session, "request") as req, mock.patch.object(
+        transport._interceptor,
+        "pre_search_features",
+        side_effect=lambda request, metadata: (request, metadata),
+    ) as pre:
+        req.return_value = Response()
+        req.return_value.status_code = 200
+        req.return_value.request = PreparedRequest()
+        req.return_value._content = featurestore_service.SearchFeaturesResponse.to_json(
+            featurestore_service.SearchFeaturesResponse()
+        )
+
+        client.search_features(
+            request={"location": "projects/sample1/locations/sample2"}
+        )
+
+        pre.assert_called_once()
+
+
 def test_search_features_rest_bad_request(
     transport: str = "rest", request_type=featurestore_service.SearchFeaturesRequest
 ):
@@ -18263,6 +18355,96 @@ def test_featurestore_service_host_with_port(transport_name):
     )
 
 
+@pytest.mark.parametrize(
+    "host,url_scheme,expected",
+    [
+        ("localhost:8080", "http", "http://localhost:8080"),
+        ("http://localhost:8080", "https", "http://localhost:8080"),
+        (
+            "https://aiplatform.googleapis.com",
+            "http",
+            "https://aiplatform.googleapis.com",
+        ),
+    ],
+)
+def test_featurestore_service_rest_host_scheme(host, url_scheme, expected):
+    transport = transports.FeaturestoreServiceRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+        host=host,
+        url_scheme=url_scheme,
+    )
+    assert transport._host == expected
+
+
+def test_featurestore_service_rest_session_pool():
+    transport = transports.FeaturestoreServiceRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    adapter = transport._session.get_adapter("https://aiplatform.googleapis.com")
+    assert (
+        adapter.poolmanager.connection_pool_kw["maxsize"]
+        == transports.rest._SESSION_POOL_MAXSIZE
+    )
+    assert transport._session.get_adapter("http://localhost:8080") is adapter
+
+
+def test_featurestore_service_rest_stub_hash():
+    transport = transports.FeaturestoreServiceRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    assert hash(transport.get_feature) == hash("GetFeature")
+    assert hash(transport.search_features) == hash("SearchFeatures")
+    assert hash(transport.get_feature) != hash(transport.update_feature)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_featurestore_service_rest_parse_json(use_orjson):
+    orjson_module = pytest.importorskip("orjson") if use_orjson else None
+    with mock.patch.object(transports.rest, "orjson", orjson_module):
+        response = featurestore_service.SearchFeaturesResponse.pb(
+            featurestore_service.SearchFeaturesResponse()
+        )
+        transports.rest._parse_json(
+            b'{"nextPageToken": "abc", "unknownField": 1}',
+            response,
+            ignore_unknown_fields=True,
+        )
+        assert response.next_page_token == "abc"
+
+        with pytest.raises(json_format.ParseError):
+            transports.rest._parse_json(b"{not json", response)
+
+        # orjson keeps the last of duplicate keys, while json_format.Parse
+        # rejects them.
+        duplicate = b'{"nextPageToken": "a", "nextPageToken": "b"}'
+        if use_orjson:
+            transports.rest._parse_json(duplicate, response)
+            assert response.next_page_token == "b"
+        else:
+            with pytest.raises(json_format.ParseError):
+                transports.rest._parse_json(duplicate, response)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_featurestore_service_rest_message_to_json(use_orjson):
+    orjson_module = pytest.importorskip("orjson") if use_orjson else None
+    message = featurestore_service.UpdateFeaturestoreRequest.pb(
+        featurestore_service.UpdateFeaturestoreRequest(
+            featurestore=gca_featurestore.Featurestore(
+                name="name_value",
+                labels={"key": "value"},
+                state=gca_featurestore.Featurestore.State.UPDATING,
+            ),
+        )
+    )
+    with mock.patch.object(transports.rest, "orjson", orjson_module):
+        body = transports.rest._message_to_json(message)
+    assert isinstance(body, bytes)
+    assert json.loads(body) == json.loads(
+        json_format.MessageToJson(message, use_integers_for_enums=True)
+    )
+
+
 @pytest.mark.parametrize(
     "transport_name",
     [
@@ -19211,6 +19393,72 @@ def test_get_operation_rest(request_type):
     assert isinstance(response, operations_pb2.Operation)
 
 
+def test_get_operation_rest_interceptor_instance_override():
+    class Interceptor(transports.FeaturestoreServiceRestInterceptor):
+        pass
+
+    transport = transports.FeaturestoreServiceRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+        interceptor=Interceptor(),
+    )
+    client = FeaturestoreServiceClient(transport=transport)
+    request = {"name": "projects/sample1/locations/sample2/operations/sample3"}
+    with mock.patch.object(Session, "request") as req, mock.patch.object(
+        transport._interceptor,
+        "pre_get_operation",
+        side_effect=lambda request, metadata: (request, metadata),
+    ) as pre, mock.patch.object(
+        transport._interceptor,
+        "post_get_operation",
+        side_effect=lambda response: response,
+    ) as post:
+        response_value = Response()
+        response_value.status_code = 200
+        response_value._content = json_format.MessageToJson(
+            operations_pb2.Operation()
+        ).encode("UTF-8")
+        req.return_value = response_value
+
+        client.get_operation(request)
+
+        pre.assert_called_once()
+        post.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "stub",
+    [
+        transports.FeaturestoreServiceRestTransport._CancelOperation,
+        transports.FeaturestoreServiceRestTransport._DeleteOperation,
+        transports.FeaturestoreServiceRestTransport._GetOperation,
+        transports.FeaturestoreServiceRestTransport._ListOperations,
+        transports.FeaturestoreServiceRestTransport._WaitOperation,
+    ],
+)
+def test_operations_rest_select_http_options(stub):
+    for http_option in stub._HTTP_OPTIONS:
+        binding = http_option["uri"].partition("{name=")[2].partition("}")[0]
+        name = binding.replace("*", "sample")
+        candidates = transports.rest._select_http_options(stub, name)
+        assert len(candidates) < len(stub._HTTP_OPTIONS)
+        assert path_template.transcode(
+            candidates, name=name
+        ) == path_template.transcode(stub._HTTP_OPTIONS, name=name)
+
+
+def test_operations_rest_http_options_read_only():
+    http_options = transports.rest._OPERATIONS_HTTP_OPTIONS
+    get_operation = http_options["google.longrunning.Operations.GetOperation"]
+    with pytest.raises(TypeError):
+        http_options["google.longrunning.Operations.GetOperation"] = []
+    with pytest.raises(TypeError):
+        get_operation[0]["uri"] = "/v1/{name=*}"
+    assert (
+        transports.FeaturestoreServiceRestTransport._GetOperation._HTTP_OPTIONS
+        is get_operation
+    )
+
+
 def test_list_operations_rest_bad_request(
     transport: str = "rest", request_type=operations_pb2.ListOperationsRequest
 ):